@@ -3,12 +3,22 @@ Here we store internal functions, don't expect
 to see something here in documentation html version.
 """
 import asyncio
+import os
 import re
+import shutil
+import struct
 import subprocess
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Sequence
 
-# Loading constants Constants.py
-from pipewire_python._constants import MESSAGES_ERROR
+# (audio format tag, bits per sample) of WAV files to pw-cat --format
+_WAV_FORMATS = {
+    (1, 8): "u8",
+    (1, 16): "s16",
+    (1, 32): "s32",
+    (3, 32): "f32",
+    (3, 64): "f64",
+}
+_WAVE_FORMAT_EXTENSIBLE = 0xFFFE
 
 
 def _print_std(
@@ -87,9 +97,29 @@ def _generate_command_by_dict(
     return array_command
 
 
+# Absolute paths of the executables found on PATH so far
+_WHICH_CACHE: Dict[str, str] = {}
+
+
+def _which(executable: str) -> str:
+    """
+    Resolve the absolute path of an executable once, subprocess only spawns
+    with posix_spawn (vfork + exec) instead of fork + exec when given one
+    """
+    path = _WHICH_CACHE.get(executable)
+    if path is None:
+        path = shutil.which(executable)
+        if path is None:
+            # Not cached, it may still be installed later on
+            return executable
+        _WHICH_CACHE[executable] = path
+    return path
+
+
 def _execute_shell_command(
     command: List[str],
     timeout: int = -1,  # *default= no limit
+    stdin=None,
     # Debug
     verbose: bool = False,
 ):
@@ -99,6 +129,7 @@ def _execute_shell_command(
     Args:
         - command (str): command line to execute. Example: 'ls -l'
         - timeout (int): (seconds) time to end the terminal process
+        - stdin (file): file read by the command as its standard input
         - verbose (bool): print variables for debug purposes
     Return:
         - stdout (str): terminal response to the command
@@ -110,26 +141,202 @@ def _execute_shell_command(
     #     command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT  # Example ['ls ','l']
     # )
 
-    with subprocess.Popen(
+    with _start_shell_command(command, stdin=stdin) as terminal_subprocess:
+        return _wait_shell_command(
+            terminal_subprocess, timeout=timeout, verbose=verbose
+        )
+
+
+def _start_shell_command(
+    command: List[str],
+    stdin=None,
+):
+    """
+    Start command on terminal via subprocess, without waiting for it
+
+    Args:
+        - command (list): command line to execute. Example: ['ls', '-l']
+        - stdin (file): file read by the command as its standard input
+    Return:
+        - terminal_subprocess (Popen): running process, with its output piped
+    """
+    # close_fds=False skips closing every inherited descriptor on each spawn,
+    # descriptors opened by Python are non-inheritable anyway (PEP 446)
+    return subprocess.Popen(
         command,
+        executable=_which(command[0]),
+        stdin=stdin,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,  # Example ['ls ','l']
-    ) as terminal_subprocess:
-        # Execute command depending or not in timeout
-        try:
-            if timeout == -1:
-                stdout, stderr = terminal_subprocess.communicate()
-            else:
-                stdout, stderr = terminal_subprocess.communicate(timeout=timeout)
-        except subprocess.TimeoutExpired:  # When script finish in time
-            terminal_subprocess.kill()
+        close_fds=False,
+    )
+
+
+def _wait_shell_command(
+    terminal_subprocess: subprocess.Popen,
+    timeout: float = -1,  # *default= no limit
+    # Debug
+    verbose: bool = False,
+):
+    """
+    Wait for a command started with `_start_shell_command`, killing it when
+    the timeout is over
+
+    Args:
+        - terminal_subprocess (Popen): process to wait for
+        - timeout (float): (seconds) time to end the terminal process
+        - verbose (bool): print variables for debug purposes
+    Return:
+        - stdout (str): terminal response to the command
+        - stderr (str): terminal response to the command
+    """
+    # Execute command depending or not in timeout
+    try:
+        if timeout == -1:
             stdout, stderr = terminal_subprocess.communicate()
+        else:
+            stdout, stderr = terminal_subprocess.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:  # When script finish in time
+        terminal_subprocess.kill()
+        stdout, stderr = terminal_subprocess.communicate()
+
+    # Print terminal output
+    _print_std(stdout, stderr, verbose=verbose)
+
+    # Return terminal output
+    return stdout, stderr
+
+
+def _execute_shell_command_fire_and_forget(
+    command: List[str],
+    # Debug
+    verbose: bool = False,
+):
+    """
+    Execute command on terminal via subprocess, discarding its standard
+    output and only keeping the error output to report failures
 
-        # Print terminal output
-        _print_std(stdout, stderr, verbose=verbose)
+    Args:
+        - command (list): command line to execute. Example: ['ls', '-l']
+        - verbose (bool): print variables for debug purposes
+    Return:
+        - returncode (int): exit status of the command
+        - stderr (bytes): terminal error response to the command
+    """
+    terminal_subprocess = subprocess.run(
+        command,
+        executable=_which(command[0]),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        close_fds=False,
+        check=False,
+    )
+
+    # Print terminal output
+    _print_std(None, terminal_subprocess.stderr, verbose=verbose)
 
-        # Return terminal output
-        return stdout, stderr
+    return terminal_subprocess.returncode, terminal_subprocess.stderr
+
+
+def _iter_shell_command_lines(
+    command: List[str],
+    # Debug
+    verbose: bool = False,
+) -> Iterator[bytes]:
+    """
+    Execute command on terminal via subprocess, reading its output line by
+    line as it is produced instead of buffering all of it
+
+    Args:
+        - command (list): command line to execute. Example: ['ls', '-l']
+        - verbose (bool): print variables for debug purposes
+    Return:
+        - lines (iterator): each line of the terminal response, as bytes
+    """
+    with subprocess.Popen(
+        command,
+        executable=_which(command[0]),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        close_fds=False,
+    ) as terminal_subprocess:
+        for line in terminal_subprocess.stdout:
+            if verbose:
+                print(f"[_iter_shell_command_lines][stdout]{line!r}")
+            yield line
+
+
+def _spawn_batch(
+    commands: Sequence[Sequence[str]],
+    # Debug
+    verbose: bool = False,
+):
+    """
+    Execute several commands on terminal, starting all of them before
+    waiting for any, output of the commands is discarded
+
+    Args:
+        - commands (list): command lines to execute. Example: [['ls', '-l']]
+        - verbose (bool): print variables for debug purposes
+    Return:
+        - returncodes (list): exit status of each command, in the same order
+    """
+    if verbose:
+        print(f"[_spawn_batch][commands]{commands}")
+
+    pids = []
+    if hasattr(os, "posix_spawn"):
+        # Send stdout and stderr of each child to /dev/null
+        file_actions = [
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_DUP2, 1, 2),
+        ]
+        try:
+            # Executables are resolved once (see _which), skipping a PATH search
+            for command in commands:
+                pids.append(
+                    os.posix_spawn(
+                        _which(command[0]),
+                        command,
+                        os.environ,
+                        file_actions=file_actions,
+                    )
+                )
+        except OSError:
+            # Commands not started yet are left to subprocess below, which
+            # raises again if the command itself can't be run
+            pass
+
+    # Python 3.7 has no posix_spawn, fall back to subprocess
+    try:
+        processes = [
+            subprocess.Popen(
+                command,
+                executable=_which(command[0]),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                close_fds=False,
+            )
+            for command in commands[len(pids) :]
+        ]
+    except OSError:
+        # Don't leave the commands already started as zombies
+        for pid in pids:
+            _wait_pid(pid)
+        raise
+
+    return [_wait_pid(pid) for pid in pids] + [process.wait() for process in processes]
+
+
+def _wait_pid(pid: int) -> int:
+    """
+    Wait for a child process started with posix_spawn, returning its exit
+    status like `Popen.wait()`
+    """
+    _, status = os.waitpid(pid, 0)
+    if os.WIFEXITED(status):
+        return os.WEXITSTATUS(status)
+    return -os.WTERMSIG(status)
 
 
 async def _execute_shell_command_async(
@@ -138,33 +345,109 @@ async def _execute_shell_command_async(
     # Debug
     verbose: bool = False,
 ):
-    """[ASYNC] Function that execute terminal commands in asyncio way
+    """[ASYNC] Function that execute terminal commands in asyncio way,
+    the event loop keeps running other tasks while the command is waited for
 
     Args:
-        - command (str): command line to execute. Example: 'ls -l'
+        - command (str|list): command line to execute. Example: 'ls -l' or
+            ['ls', '-l'], a list is executed directly, without a shell
+        - timeout (float): (seconds) time to end the terminal process
     Return:
         - stdout (str): terminal response to the command.
         - stderr (str): terminal response to the command.
     """
-    if timeout == -1:
-        # No timeout
+    if isinstance(command, str):
         terminal_process_async = await asyncio.create_subprocess_shell(
             command, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
         )
+    else:
+        terminal_process_async = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+    # Execute command depending or not in timeout
+    communicate = terminal_process_async.communicate()
+    try:
+        if timeout == -1:
+            stdout, stderr = await communicate
+        else:
+            stdout, stderr = await asyncio.wait_for(communicate, timeout=timeout)
+    except asyncio.TimeoutError:  # When script finish in time
+        terminal_process_async.kill()
         stdout, stderr = await terminal_process_async.communicate()
+
+    if verbose:
         print(
-            f"[_execute_shell_command_async]\
-                [{command!r} exited with\
-                {terminal_process_async.returncode}]"
+            f"[_execute_shell_command_async]"
+            f"[{command!r} exited with {terminal_process_async.returncode}]"
         )
-        _print_std(stdout, stderr, verbose=verbose)
-
-    else:
-        raise NotImplementedError(MESSAGES_ERROR["NotImplementedError"])
+    _print_std(stdout, stderr, verbose=verbose)
 
     return stdout, stderr
 
 
+def _parse_wav_header(
+    audio_filename: str,
+    # Debug
+    verbose: bool = False,
+) -> Optional[Dict]:
+    """
+    Read the format of a WAV file walking its RIFF chunks until the samples
+
+    Args:
+        - audio_filename (str): path of the WAV file
+        - verbose (bool): print variables for debug purposes
+    Return:
+        - wav_info (dict): rate, channels and pw-cat format of the samples,
+            plus offset and size in bytes of the samples, None when the file
+            is not a WAV file with a format supported by pw-cat
+    """
+    wav_info = None
+    with open(audio_filename, "rb") as audio_file:
+        header = audio_file.read(12)
+        if header[:4] != b"RIFF" or header[8:] != b"WAVE":
+            return None
+
+        header = audio_file.read(8)
+        while len(header) == 8:
+            chunk_id, chunk_size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                fmt = audio_file.read(chunk_size)
+                # Too short or truncated "fmt " chunk, left to pw-cat
+                if chunk_size < 16 or len(fmt) != chunk_size:
+                    return None
+                format_tag, channels, rate = struct.unpack_from("<HHI", fmt)
+                bits_per_sample = struct.unpack_from("<H", fmt, 14)[0]
+                if format_tag == _WAVE_FORMAT_EXTENSIBLE and chunk_size >= 26:
+                    # First two bytes of the sub format GUID are the format tag
+                    format_tag = struct.unpack_from("<H", fmt, 24)[0]
+                _format = _WAV_FORMATS.get((format_tag, bits_per_sample))
+                if _format is None:
+                    return None
+                wav_info = {"rate": rate, "channels": channels, "format": _format}
+            elif chunk_id == b"data":
+                if wav_info is None:
+                    return None
+                wav_info["data_offset"] = audio_file.tell()
+                wav_info["data_size"] = chunk_size
+                break
+            else:
+                audio_file.seek(chunk_size, os.SEEK_CUR)
+            # Chunks are aligned to 2 bytes
+            if chunk_size % 2:
+                audio_file.seek(1, os.SEEK_CUR)
+            header = audio_file.read(8)
+        else:
+            return None
+
+    if verbose:
+        print(f"[_parse_wav_header][{audio_filename}]{wav_info}")
+
+    return wav_info
+
+
 def _generate_dict_list_targets(
     longstring: str,  # string output of shell
     # Debug
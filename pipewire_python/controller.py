@@ -6,6 +6,11 @@ In the next pages you'll see documentation of each Python component
 """
 
 # import warnings
+import asyncio
+import atexit
+import os
+import subprocess
+import threading
 
 # Loading constants Constants.py
 from pipewire_python._constants import (
@@ -18,11 +23,15 @@ from pipewire_python._constants import (
 from pipewire_python._utils import (
     _drop_keys_with_none_values,
     _execute_shell_command,
+    _execute_shell_command_async,
     _filter_by_type,
     _generate_command_by_dict,
     _generate_dict_interfaces,
     _generate_dict_list_targets,
     _get_dict_from_stdout,
+    _parse_wav_header,
+    _start_shell_command,
+    _wait_shell_command,
 )
 
 # [DEPRECATED] [FLAKE8] TO_AVOID_F401 PEP8
@@ -40,12 +49,45 @@ from pipewire_python._utils import (
 #     # "_execute_shell_command",
 # ]
 
+# Commands started with `await_completion=False` that are still running
+_BACKGROUND_PROCESSES = set()
+_BACKGROUND_LOCK = threading.Lock()
+
+
+def _terminate_background_processes():
+    """Terminate the commands left running without `join()`, their waiting
+    threads (and so their timeouts) end with the interpreter but they don't.
+    """
+    with _BACKGROUND_LOCK:
+        processes = list(_BACKGROUND_PROCESSES)
+    for process in processes:
+        if process.poll() is None:
+            process.terminate()
+    for process in processes:
+        try:
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+atexit.register(_terminate_background_processes)
+
 
 class Controller:
     """
     Class that controls pipewire command line interface
     with shell commands, handling outputs, loading default
     configs and more.
+
+    Commands are started with the absolute path of `pw-cat`, no `preexec_fn`,
+    `close_fds=False` and no new session, which lets `subprocess` launch them
+    with `posix_spawn` (vfork + exec) instead of copying the Python process
+    with fork, check it with:
+
+    ```bash
+    #!/bin/bash
+    strace -f -e trace=clone,clone3,vfork,execve python3 tutorial.py
+    ```
     """
 
     _pipewire_cli = {  # Help
@@ -99,7 +141,19 @@ class Controller:
         # Get defaults from output of:
         pw-cat -h
         ```
+
+        The same controller can be reused for every playback and record, as
+        a context manager it waits on exit for the ones still running.
         """
+        # Commands started without awaiting completion, see `join()`
+        self._running = []
+        # Parsed WAV headers by path, see `get_wav_info()`
+        self._wav_info = {}
+        # (configs, `pw-cat` arguments) of `_pipewire_configs`, built when needed
+        self._configs_command = None
+        # Play WAV files with their own sample format, see `set_config()`
+        self._auto_format = False
+
         # LOAD ALL DEFAULT PARAMETERS
 
         mycommand = ["pw-cat", "-h"]
@@ -128,9 +182,18 @@ class Controller:
         if verbose:
             print(self._pipewire_configs)
 
-        # Load values of list targets
-        self.load_list_targets(mode="playback", verbose=verbose)
-        self.load_list_targets(mode="record", verbose=verbose)
+        # Values of list targets, loaded by the first `get_list_targets()`
+        self._pipewire_list_targets = {
+            "list_playback": None,
+            "list_record": None,
+        }
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        # Wait for commands started without awaiting completion
+        self.join()
 
     def _help_cli(
         self,
@@ -258,6 +321,8 @@ class Controller:
         _format=None,
         volume=None,
         quality=None,
+        buffer_frames=None,
+        auto_format=None,
         # Debug
         verbose=False,
     ):
@@ -276,9 +341,14 @@ class Controller:
             rate : Set sample rate [8000,11025,16000,22050,44100,48000,88200,96000,176400,192000,352800,384000]
             channels : Numbers of channels [1,2]
             channels_map : ["stereo", "surround-51", "FL,FR", ...]
-            _format : ["u8", "s8", "s16", "s32", "f32", "f64"]
+            _format : ["u8", "s8", "s16", "s32", "f32", "f64"], applied to WAV files
+                too unless auto_format is set
             volume : Stream volume [0.000, 1.000]
             quality : Resampler quality [0, 15]
+            buffer_frames : Node latency in samples, same as latency but fixed in frames
+                so PipeWire keeps its quantum *example=1024
+            auto_format : True plays WAV files with the sample format of the file
+                (`s16` for most of them) instead of `_format`, False sets back `_format`
             verbose (`bool`): True enable debug logs. *default=False
 
         Returns:
@@ -286,7 +356,8 @@ class Controller:
 
         More:
             Check all links listed at the beginning of this page
-        """  # 1 - media_type
+        """
+        # 1 - media_type
         if media_type:
             self._pipewire_configs["--media-type"] = str(media_type)
         elif media_type is None:
@@ -419,8 +490,38 @@ class Controller:
             raise ValueError(
                 f"{MESSAGES_ERROR['ValueError']}[volume='{volume}'] EMPTY VALUE"
             )
+        # 12 - buffer_frames
+        if buffer_frames:
+            if latency:
+                raise ValueError(
+                    f"{MESSAGES_ERROR['ValueError']}[buffer_frames='{buffer_frames}']\
+                         USE latency OR buffer_frames, NOT BOTH"
+                )
+            # bool is an int subclass, but `--latency True` isn't a latency
+            if (
+                not isinstance(buffer_frames, bool)
+                and isinstance(buffer_frames, int)
+                and buffer_frames > 0
+            ):
+                # pw-cat reads a latency without unit as samples
+                self._pipewire_configs["--latency"] = str(buffer_frames)
+            else:
+                raise ValueError(
+                    f"{MESSAGES_ERROR['ValueError']}[buffer_frames='{buffer_frames}']\
+                         NOT A POSITIVE INTEGER"
+                )
+        elif buffer_frames is None:
+            pass
+        else:
+            raise ValueError(
+                f"{MESSAGES_ERROR['ValueError']}[buffer_frames='{buffer_frames}'] EMPTY VALUE"
+            )
 
-        # 12 - verbose cli
+        # 13 - auto_format
+        if auto_format is not None:
+            self._auto_format = bool(auto_format)
+
+        # 14 - verbose cli
         if verbose:  # True
             self._pipewire_configs["--verbose"] = "    "
         else:
@@ -467,7 +568,8 @@ class Controller:
         verbose: bool = False,
     ):
         """Returns a list of targets to playback or record. Then you can use
-        the output to select a device to playback or record.
+        the output to select a device to playback or record. Targets are
+        loaded with `load_list_targets(...)` the first time they are needed.
 
         Returns:
             - `_pipewire_list_targets`
@@ -509,6 +611,10 @@ class Controller:
         }
         ```
         """
+        for mode in ("playback", "record"):
+            if self._pipewire_list_targets[f"list_{mode}"] is None:
+                self.load_list_targets(mode=mode, verbose=verbose)
+
         if verbose:
             print(self._pipewire_list_targets)
         return self._pipewire_list_targets
@@ -567,6 +673,8 @@ class Controller:
     def playback(
         self,
         audio_filename: str = "myplayback.wav",
+        await_completion: bool = True,
+        raw: bool = False,
         # Debug
         verbose: bool = False,
     ):
@@ -581,32 +689,64 @@ class Controller:
 
         Args:
             audio_filename (`str`): Path of the file to be played. *default='myplayback.wav'
+            await_completion (`bool`): False returns as soon as `pw-cat` is started,
+                the outputs are then collected by `join()`, which must be called
+                (or the controller used in a `with` block) before the script
+                ends, otherwise `pw-cat` is terminated at exit. *default=True
+            raw (`bool`): True sends the samples of a WAV file to `pw-cat --raw`
+                with the format read by `get_wav_info(...)`, so `pw-cat` skips
+                opening the file itself. Other files are played as usual. *default=False
             verbose (`bool`): True enable debug logs. *default=False
 
         Returns:
             - stdout (`str`): Shell response to the command in stdout format
             - stderr (`str`): Shell response response to the command in stderr format
+            (both `None` when not awaiting completion)
         """
         # warnings.warn("The name of the function may change on future releases", DeprecationWarning)
 
-        mycommand = [
-            "pw-cat",
-            "--playback",
-            audio_filename,
-        ] + _generate_command_by_dict(mydict=self._pipewire_configs, verbose=verbose)
+        wav_info = self._find_wav_info(audio_filename, verbose=verbose) if raw else None
+        # Only when nothing follows the samples, pw-cat reads until the end
+        if wav_info is not None and wav_info["data_offset"] + wav_info[
+            "data_size"
+        ] == os.path.getsize(audio_filename):
+            # Samples are read by pw-cat from its stdin, starting after the header
+            mycommand = self._pw_cat_command(
+                "--playback",
+                "-",
+                raw=True,
+                configs={
+                    **self._pipewire_configs,
+                    "--rate": str(wav_info["rate"]),
+                    "--channels": str(wav_info["channels"]),
+                    "--format": wav_info["format"],
+                },
+                verbose=verbose,
+            )
+            with open(audio_filename, "rb") as audio_file:
+                audio_file.seek(wav_info["data_offset"])
+                return self._run(
+                    mycommand=mycommand,
+                    timeout=-1,
+                    await_completion=await_completion,
+                    stdin=audio_file,
+                    verbose=verbose,
+                )
 
-        if verbose:
-            print(f"[mycommand]{mycommand}")
+        mycommand = self._playback_command(audio_filename, verbose=verbose)
 
-        stdout, stderr = _execute_shell_command(
-            command=mycommand, timeout=-1, verbose=verbose
+        return self._run(
+            mycommand=mycommand,
+            timeout=-1,
+            await_completion=await_completion,
+            verbose=verbose,
         )
-        return stdout, stderr
 
     def record(
         self,
         audio_filename: str = "myplayback.wav",
         timeout_seconds=5,
+        await_completion: bool = True,
         # Debug
         verbose: bool = False,
     ):
@@ -621,25 +761,279 @@ class Controller:
 
         Args:
             audio_filename (`str`): Path of the file to be played. *default='myplayback.wav'
+            timeout_seconds (`int`): Seconds recording before stopping `pw-cat`. *default=5
+            await_completion (`bool`): False returns as soon as `pw-cat` is started,
+                the outputs are then collected by `join()`, which must be called
+                (or the controller used in a `with` block) before the script
+                ends, otherwise `pw-cat` is terminated at exit. *default=True
             verbose (`bool`): True enable debug logs. *default=False
 
         Returns:
             - stdout (`str`): Shell response to the command in stdout format
             - stderr (`str`): Shell response response to the command in stderr format
+            (both `None` when not awaiting completion)
         """
         # warnings.warn("The name of the function may change on future releases", DeprecationWarning)
 
-        mycommand = ["pw-cat", "--record", audio_filename] + _generate_command_by_dict(
-            mydict=self._pipewire_configs, verbose=verbose
+        mycommand = self._pw_cat_command("--record", audio_filename, verbose=verbose)
+
+        return self._run(
+            mycommand=mycommand,
+            timeout=timeout_seconds,
+            await_completion=await_completion,
+            verbose=verbose,
         )
 
-        if verbose:
-            print(f"[mycommand]{mycommand}")
+    async def playback_async(
+        self,
+        audio_filename: str = "myplayback.wav",
+        # Debug
+        verbose: bool = False,
+    ):
+        """[ASYNC] Same as `playback(...)`, but awaiting `pw-cat` without
+        blocking the event loop, so several streams can be driven with
+        `asyncio.gather`.
+
+        Args:
+            audio_filename (`str`): Path of the file to be played. *default='myplayback.wav'
+            verbose (`bool`): True enable debug logs. *default=False
+
+        Returns:
+            - stdout (`str`): Shell response to the command in stdout format
+            - stderr (`str`): Shell response response to the command in stderr format
+        """
+        mycommand = self._playback_command(audio_filename, verbose=verbose)
 
-        stdout, stderr = _execute_shell_command(
+        return await _execute_shell_command_async(
+            command=mycommand, timeout=-1, verbose=verbose
+        )
+
+    async def record_async(
+        self,
+        audio_filename: str = "myplayback.wav",
+        timeout_seconds=5,
+        # Debug
+        verbose: bool = False,
+    ):
+        """[ASYNC] Same as `record(...)`, but awaiting `pw-cat` without
+        blocking the event loop, so several streams can be driven with
+        `asyncio.gather`.
+
+        Args:
+            audio_filename (`str`): Path of the file to be played. *default='myplayback.wav'
+            timeout_seconds (`int`): Seconds recording before stopping `pw-cat`. *default=5
+            verbose (`bool`): True enable debug logs. *default=False
+
+        Returns:
+            - stdout (`str`): Shell response to the command in stdout format
+            - stderr (`str`): Shell response response to the command in stderr format
+        """
+        mycommand = self._pw_cat_command("--record", audio_filename, verbose=verbose)
+
+        return await _execute_shell_command_async(
             command=mycommand, timeout=timeout_seconds, verbose=verbose
         )
-        return stdout, stderr
+
+    def run_batch(
+        self,
+        jobs,
+        # Debug
+        verbose: bool = False,
+    ):
+        """Run several playbacks and records at the same time, so the total
+        time is the one of the longest job instead of the sum of all of them.
+        Every job uses the configs of this controller (same `--latency`
+        included), for example:
+
+        ```python
+        >>> Controller().run_batch([
+        ...     ("playback", "docs/beers.wav"),
+        ...     ("record", "docs/5sec_record.wav", 5),  # timeout_seconds
+        ... ])
+        ```
+
+        Args:
+            jobs (`list`): tuples of (`"playback"`, audio_filename) or
+                (`"record"`, audio_filename, timeout_seconds)
+            verbose (`bool`): True enable debug logs. *default=False
+
+        Returns:
+            - outputs (`list`): (stdout, stderr) of each job, in the same order
+        """
+        return asyncio.run(self.run_batch_async(jobs=jobs, verbose=verbose))
+
+    async def run_batch_async(
+        self,
+        jobs,
+        # Debug
+        verbose: bool = False,
+    ):
+        """[ASYNC] Same as `run_batch(...)`, to be awaited from a running
+        event loop.
+        """
+        coroutines = []
+        for mode, *args in jobs:
+            if mode == "playback":
+                coroutines.append(self.playback_async(*args, verbose=verbose))
+            elif mode == "record":
+                coroutines.append(self.record_async(*args, verbose=verbose))
+            else:
+                for coroutine in coroutines:
+                    coroutine.close()
+                raise ValueError(
+                    f"{MESSAGES_ERROR['ValueError']}[mode='{mode}'] ONLY playback OR record"
+                )
+        return list(await asyncio.gather(*coroutines))
+
+    def get_wav_info(
+        self,
+        audio_filename: str,
+        # Debug
+        verbose: bool = False,
+    ):
+        """Returns the format of the samples of a WAV file, reading its header
+        only once while the file is not modified.
+
+        Args:
+            audio_filename (`str`): Path of the WAV file
+            verbose (`bool`): True enable debug logs. *default=False
+
+        Returns:
+            - wav_info (`dict`): `rate`, `channels` and `format` (as `pw-cat --format`)
+            of the samples, with `data_offset` and `data_size` in bytes of them,
+            `None` if the file is not a WAV file supported by `pw-cat --raw`
+
+        Examples:
+        ```python
+        >>> Controller().get_wav_info("docs/beers.wav")
+        {'rate': 44100, 'channels': 2, 'format': 's16', 'data_offset': 78, 'data_size': 1331712}
+        ```
+        """
+        path = os.path.abspath(audio_filename)
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._wav_info.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        wav_info = _parse_wav_header(audio_filename=path, verbose=verbose)
+        self._wav_info[path] = (mtime, wav_info)
+        return wav_info
+
+    def _find_wav_info(
+        self,
+        audio_filename,
+        # Debug
+        verbose: bool = False,
+    ):
+        """Same as `get_wav_info(...)`, but `None` when the file can't be read,
+        `pw-cat` then plays it as usual and reports the error"""
+        try:
+            return self.get_wav_info(audio_filename, verbose=verbose)
+        except OSError:
+            return None
+
+    def _playback_command(
+        self,
+        audio_filename,
+        # Debug
+        verbose: bool = False,
+    ):
+        """Build the `pw-cat --playback` command line, with the sample format
+        of the WAV file when `auto_format` is set"""
+        configs = None
+        if self._auto_format:
+            wav_info = self._find_wav_info(audio_filename, verbose=verbose)
+            if wav_info is not None:
+                configs = {**self._pipewire_configs, "--format": wav_info["format"]}
+
+        return self._pw_cat_command(
+            "--playback", audio_filename, configs=configs, verbose=verbose
+        )
+
+    def _pw_cat_command(
+        self,
+        mode,  # --playback or --record
+        audio_filename,
+        raw: bool = False,
+        configs=None,
+        # Debug
+        verbose: bool = False,
+    ):
+        """Build the `pw-cat` command line with the current configs"""
+        if configs is not None:
+            configs_command = _generate_command_by_dict(mydict=configs)
+        else:
+            # Built again when the configs changed, even through `get_config()`
+            configs = tuple(self._pipewire_configs.items())
+            if self._configs_command is None or self._configs_command[0] != configs:
+                self._configs_command = (
+                    configs,
+                    _generate_command_by_dict(mydict=self._pipewire_configs),
+                )
+            configs_command = self._configs_command[1]
+        mycommand = ["pw-cat", mode] + (["--raw"] if raw else [])
+        mycommand += [audio_filename] + configs_command
+
+        if verbose:
+            print(f"[mycommand]{mycommand}")
+
+        return mycommand
+
+    def _run(
+        self,
+        mycommand,
+        timeout=-1,
+        await_completion: bool = True,
+        stdin=None,
+        # Debug
+        verbose: bool = False,
+    ):
+        """Execute a `pw-cat` command, or start it and leave a background
+        thread waiting for it (timeout included) until `join()` is called.
+        Commands still running when the interpreter exits are terminated.
+        """
+        if await_completion:
+            return _execute_shell_command(
+                command=mycommand, timeout=timeout, stdin=stdin, verbose=verbose
+            )
+
+        terminal_subprocess = _start_shell_command(command=mycommand, stdin=stdin)
+        with _BACKGROUND_LOCK:
+            _BACKGROUND_PROCESSES.add(terminal_subprocess)
+        output = {}
+
+        def _wait():
+            try:
+                with terminal_subprocess:
+                    output["std"] = _wait_shell_command(
+                        terminal_subprocess, timeout=timeout, verbose=verbose
+                    )
+            finally:
+                with _BACKGROUND_LOCK:
+                    _BACKGROUND_PROCESSES.discard(terminal_subprocess)
+
+        waiter = threading.Thread(target=_wait, daemon=True)
+        waiter.start()
+        self._running.append((waiter, output))
+        return None, None
+
+    def join(self):
+        """Wait for every `playback(...)` or `record(...)` started with
+        `await_completion=False`, so several streams can run at the same time.
+
+        Args:
+            Nothing
+
+        Returns:
+            - outputs (`list`): (stdout, stderr) of each command, in the order
+            they were started
+        """
+        running, self._running = self._running, []
+        outputs = []
+        for waiter, output in running:
+            waiter.join()
+            outputs.append(output.get("std", (None, None)))
+        return outputs
 
     def clear_devices(
         self,
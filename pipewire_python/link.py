@@ -47,12 +47,32 @@ Examples
 >>> source.left.connect(sink.right)
 """
 
-from dataclasses import dataclass
-from enum import Enum
-from typing import List, Union
+import asyncio
+import atexit
+import contextlib
+import itertools
+import queue
+import re
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from pipewire_python._utils import (
-    _execute_shell_command,
+    _execute_shell_command_fire_and_forget,
+    _iter_shell_command_lines,
+    _spawn_batch,
 )
 
 __all__ = [
@@ -67,10 +87,43 @@ __all__ = [
     "list_inputs",
     "list_outputs",
     "list_links",
+    "list_all",
+    "list_all_async",
+    "connect_all",
+    "batch",
+    "set_cache_ttl",
+    "invalidate_cache",
+    "start_link_monitor",
+    "stop_link_monitor",
+    "start_pw_cli_session",
+    "stop_pw_cli_session",
 ]
 
 
 PW_LINK_COMMAND = "pw-link"
+PW_CLI_COMMAND = "pw-cli"
+
+# Leading `pw-link` arguments of every connection/disconnection command
+_CONNECT_BASE = (PW_LINK_COMMAND,)
+_DISCONNECT_BASE = (PW_LINK_COMMAND, "--disconnect")
+
+# Seconds a `pw-link` listing may be reused for, 0 disables the cache
+_CACHE_TTL = 0.0
+_LISTING_CACHE: Dict[str, Tuple[float, Tuple[Tuple[int, str], ...]]] = {}
+
+_CONNECT_MSG = "Cannot connect an {0} to another {0}."
+_DISCONNECT_MSG = "Cannot disconnect an {0} from another {0}."
+
+# Matches the data of one `pw-link --links --id` row linked to the port above
+_LINK_ARROW_REGEX = re.compile(r"^(\|->|\|<-) +(\d+) +(.*)$")
+
+# Matches one `pw-link --monitor` row: change marker, then a `--id` row
+_MONITOR_LINE_REGEX = re.compile(rb"^([+=-])\s*(\d+) +(.*?) *$")
+
+# Link objects are immutable; `slots` is only understood from Python 3.10 on
+_DATACLASS_OPTIONS = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS["slots"] = True
 
 
 class InvalidLink(ValueError):
@@ -81,14 +134,22 @@ class FailedToLinkPorts(ValueError):
     """Failed to Link the Specified Ports."""
 
 
-class PortType(Enum):
-    """Pipewire Channel Type - Input or Output."""
+class PortType:
+    """Pipewire Channel Type - Input or Output, as plain string constants."""
 
-    INPUT = 1
-    OUTPUT = 2
+    INPUT = "input"
+    OUTPUT = "output"
 
 
-@dataclass
+# Whether the other port of a link goes first (as the output), by the types
+# of both ports, missing combinations can't be linked
+_OTHER_FIRST = {
+    (PortType.INPUT, PortType.OUTPUT): True,
+    (PortType.OUTPUT, PortType.INPUT): False,
+}
+
+
+@dataclass(eq=False, **_DATACLASS_OPTIONS)
 class Port:
     """
     Pipewire Link Port Object.
@@ -96,7 +157,8 @@ class Port:
     Port for an input or output in Pipewire link. This is the basic, structural
     component for the Python wrapper of Pipewire-link. Ports may be connected by
     links, and Inputs/Outputs consist of one or more of these Port objects
-    corresponding to left/right channels.
+    corresponding to left/right channels. Ports of the same class are equal
+    (and hash alike) when they have the same device and name.
 
     Attributes
     ----------
@@ -106,7 +168,7 @@ class Port:
                     Pipewire device name.
     name:           str
                     Pipewire device connector name, (typically uses FL or FR).
-    port_type:      PortType
+    port_type:      str
                     Designation of connector as input or output.
     is_midi:        bool
                     Indicator to mark that the port is a Midi connection.
@@ -115,45 +177,68 @@ class Port:
     device: str
     name: str
     id: int
-    port_type: PortType
+    port_type: str
     is_midi: bool = False
+    # Qualified "device:name" form used by pw-link, built once per port
+    _qualified: str = field(init=False, repr=False, compare=False)
+    # Channel tag ending the name (e.g. "FL" for "playback_FL"), used to find
+    # the left/right channels when pairing
+    _channel: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "_qualified", f"{self.device}:{self.name}")
+        object.__setattr__(self, "_channel", self.name.rpartition("_")[2].upper())
 
-    def _join_arguments(self, other: "Port", message: str) -> List[str]:
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._qualified == other._qualified
+
+    def __hash__(self) -> int:
+        return hash(self._qualified)
+
+    def _link_order(self, other: "Port", message: str) -> Tuple[str, str]:
+        """
+        Order the qualified names of this port and another one as output, then
+        input for the connection/disconnection command.
+        """
+        other_first = _OTHER_FIRST.get((self.port_type, other.port_type))
+        if other_first is None:
+            raise InvalidLink(message.format(self.port_type))
+        if other_first:
+            # Valid -- Output (other) First
+            return other._qualified, self._qualified
+        # Valid -- Output (self) First
+        return self._qualified, other._qualified
+
+    def _join_arguments(self, other: "Port", message: str) -> Tuple[str, ...]:
         """
         Generate a list of arguments to appropriately set output, then input
         for the connection/disconnection command.
         """
-        args = [PW_LINK_COMMAND]
-        if self.port_type == PortType.INPUT:
-            if other.port_type == PortType.INPUT:
-                raise InvalidLink(message.format("input"))
-            # Valid -- Append the Output (other) First
-            args.append(":".join((other.device, other.name)))
-            args.append(":".join((self.device, self.name)))
-        else:
-            if other.port_type == PortType.OUTPUT:
-                raise InvalidLink(message.format("output"))
-            # Valid -- Append the Output (self) First
-            args.append(":".join((self.device, self.name)))
-            args.append(":".join((other.device, other.name)))
-        return args
+        return (*_CONNECT_BASE, *self._link_order(other, message))
 
     def connect(self, other: "Port") -> None:
         """Connect this channel to another channel."""
-        args = self._join_arguments(
-            other=other, message="Cannot connect an {} to another {}."
-        )
-        stdout, _ = _execute_shell_command(args)
-        if b"failed to link ports" in stdout:
-            raise FailedToLinkPorts(stdout)
+        command = self._join_arguments(other, _CONNECT_MSG)
+        if _defer([command], connect=True):
+            return
+        _, stderr = _execute_shell_command_fire_and_forget(command)
+        _forget_links()
+        if b"failed to link ports" in stderr:
+            raise FailedToLinkPorts(stderr)
+
+    def _disconnect_arguments(self, other: "Port") -> Tuple[str, ...]:
+        """Generate the list of arguments to disconnect from another port."""
+        return (*_DISCONNECT_BASE, *self._link_order(other, _DISCONNECT_MSG))
 
     def disconnect(self, other: "Port") -> None:
         """Disconnect this channel from another."""
-        args = self._join_arguments(
-            other=other, message="Cannot disconnect an {} from another {}."
-        )
-        args.append("--disconnect")
-        _ = _execute_shell_command(args)
+        command = self._disconnect_arguments(other)
+        if _defer([command], connect=False):
+            return
+        _execute_shell_command_fire_and_forget(command)
+        _forget_links()
 
 
 class Input(Port):
@@ -171,12 +256,20 @@ class Input(Port):
                     Pipewire device name.
     name:           str
                     Pipewire device connector name, (typically uses FL or FR).
-    port_type:      PortType
+    port_type:      str
                     Designation of connector as an input. Set to PortType.INPUT
     is_midi:        bool
                     Indicator to mark that the port is a Midi connection.
     """
 
+    __slots__ = ()
+
+    def _link_order(self, other: Port, message: str) -> Tuple[str, str]:
+        """Order this input after the output it is linked with."""
+        if other.port_type == PortType.INPUT:
+            raise InvalidLink(message.format("input"))
+        return other._qualified, self._qualified
+
 
 class Output(Port):
     """
@@ -193,14 +286,22 @@ class Output(Port):
                     Pipewire device name.
     name:           str
                     Pipewire device connector name, (typically uses FL or FR).
-    port_type:      PortType
+    port_type:      str
                     Designation of connector as output. Set to PortType.OUTPUT
     is_midi:        bool
                     Indicator to mark that the port is a Midi connection.
     """
 
+    __slots__ = ()
+
+    def _link_order(self, other: Port, message: str) -> Tuple[str, str]:
+        """Order this output before the input it is linked with."""
+        if other.port_type == PortType.OUTPUT:
+            raise InvalidLink(message.format("output"))
+        return self._qualified, other._qualified
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class StereoInput:
     """
     Stereo (paired) Pipewire Input Object.
@@ -246,28 +347,14 @@ class StereoInput:
 
     def connect(self, other: "StereoOutput") -> Union["StereoLink", "Link", None]:
         """Connect this input to an output."""
-        connections = []
-        if self.left and other.left:
-            self.left.connect(other.left)
-            connections.append(Link(input=self.left, output=other.left, id=None))
-        if self.right and other.right:
-            self.right.connect(other.right)
-            connections.append(Link(input=self.right, output=other.right, id=None))
-        if connections:
-            if len(connections) > 1:
-                return StereoLink(left=connections[0], right=connections[1])
-            return connections
-        return None
+        return _stereo_op(self, other)
 
     def disconnect(self, other: Union["StereoOutput", "StereoLink", "Link"]) -> None:
         """Disconnect this input from an output."""
-        if self.left and other.left:
-            self.left.disconnect(other.left)
-        if self.right and other.right:
-            self.right.disconnect(other.right)
+        _stereo_op(self, other, disconnect=True)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class StereoOutput:
     """
     Stereo (paired) Pipewire Output Object.
@@ -313,28 +400,14 @@ class StereoOutput:
 
     def connect(self, other: "StereoInput") -> Union["StereoLink", "Link", None]:
         """Connect this input to an output."""
-        connections = []
-        if self.left and other.left:
-            self.left.connect(other.left)
-            connections.append(Link(input=other.left, output=self.left, id=None))
-        if self.right and other.right:
-            self.right.connect(other.right)
-            connections.append(Link(input=other.right, output=self.right, id=None))
-        if connections:
-            if len(connections) > 1:
-                return StereoLink(left=connections[0], right=connections[1])
-            return connections
-        return None
+        return _stereo_op(self, other)
 
     def disconnect(self, other: Union["StereoInput", "StereoLink", "Link"]) -> None:
         """Disconnect this input from an output."""
-        if self.left and other.left:
-            self.left.disconnect(other.left)
-        if self.right and other.right:
-            self.right.disconnect(other.right)
+        _stereo_op(self, other, disconnect=True)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class Link:
     """
     Pipewire Link Object.
@@ -357,14 +430,15 @@ class Link:
 
     def disconnect(self):
         """Disconnect the Link."""
-        self.input.disconnect(self.output)
+        if not _destroy_links((self,)):
+            self.input.disconnect(self.output)
 
     def reconnect(self):
         """Reconnect the Link if Previously Disconnected."""
         self.input.connect(self.output)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class StereoLink:
     """
     Stereo (paired) Pipewire Linked Object.
@@ -395,16 +469,17 @@ class StereoLink:
 
     def disconnect(self):
         """Disconnect the stereo pair of links."""
-        self.left.disconnect()
-        self.right.disconnect()
+        if not _destroy_links((self.left, self.right)):
+            _spawn_links([_disconnect_argv(self.left), _disconnect_argv(self.right)])
 
     def reconnect(self):
         """Reconnect the Link Pair if Previously Disconnected."""
-        self.left.reconnect()
-        self.right.reconnect()
+        _connect_many(
+            [(self.left.input, self.left.output), (self.right.input, self.right.output)]
+        )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class LinkGroup:
     """
     Grouped Pipewire Link Objects.
@@ -439,27 +514,270 @@ class LinkGroup:
 
     def disconnect(self):
         """Disconnect the stereo pair of links."""
-        for link in self.links:
-            link.disconnect()
+        # Links already know their direction, skip the input/output checks
+        if not _destroy_links(self.links):
+            _spawn_links([_disconnect_argv(link) for link in self.links])
 
     def reconnect(self):
         """Reconnect the Link Pair if Previously Disconnected."""
         for link in self.links:
-            link.disconnect()
+            link.reconnect()
+
+
+def _disconnect_argv(link: Link) -> Tuple[str, str, str, str]:
+    """Helper function to generate the arguments that disconnect a link"""
+    return (*_DISCONNECT_BASE, link.output._qualified, link.input._qualified)
 
 
-def _split_id_from_data(command) -> List[List[str]]:
-    """Helper function to generate a list of channels"""
-    stdout, _ = _execute_shell_command([PW_LINK_COMMAND, command, "--id"])
-    data_sets = []
-    for data_response in stdout.decode("utf-8").split("\n"):
-        ports = data_response.lstrip().split(" ", maxsplit=1)
-        if len(ports) == 2:
-            data_sets.append([port.strip(" ") for port in ports])
-    return data_sets
+def _forget_links() -> None:
+    """Helper function to drop the cached links listing once links changed"""
+    _LISTING_CACHE.pop("--links", None)
 
 
-def list_inputs(pair_stereo: bool = True) -> List[Union[StereoInput, Input]]:
+def _spawn_links(commands: Sequence[Sequence[str]], connect: bool = False) -> List[int]:
+    """Helper function to run a batch of link changes and forget stale links"""
+    if _defer(commands, connect):
+        return [0] * len(commands)
+    returncodes = _spawn_batch(commands)
+    _forget_links()
+    return returncodes
+
+
+def _stereo_op(stereo, other, disconnect: bool = False):
+    """
+    Helper function to connect (or disconnect) the left and right channels of
+    a stereo input/output with the matching channels of another one
+    """
+    pairs = [
+        (port, other_port)
+        for port, other_port in ((stereo.left, other.left), (stereo.right, other.right))
+        if port and other_port
+    ]
+    _connect_many(pairs, disconnect=disconnect)
+    if disconnect:
+        return None
+    connections = [
+        (
+            Link(input=port, output=other_port, id=None)
+            if isinstance(port, Input)
+            else Link(input=other_port, output=port, id=None)
+        )
+        for port, other_port in pairs
+    ]
+    if len(connections) > 1:
+        return StereoLink(left=connections[0], right=connections[1])
+    return connections or None
+
+
+def _connect_many(pairs: Sequence[Tuple[Port, Port]], disconnect: bool = False) -> None:
+    """
+    Helper function to connect (or disconnect) several pairs of ports with a
+    single batch of `pw-link` processes instead of one process at a time
+    """
+    if disconnect:
+        _spawn_links([port._disconnect_arguments(other) for port, other in pairs])
+        return
+    commands = [port._join_arguments(other, _CONNECT_MSG) for port, other in pairs]
+    _raise_failed(commands, _spawn_links(commands, connect=True))
+
+
+def _raise_failed(commands: Sequence[Sequence[str]], returncodes: Sequence[int]):
+    """Helper function to report the connection commands that did not succeed"""
+    failed = [
+        command for command, returncode in zip(commands, returncodes) if returncode != 0
+    ]
+    if failed:
+        raise FailedToLinkPorts(f"failed to link ports: {failed}")
+
+
+async def connect_all(pairs: Iterable[Tuple[Port, Port]]) -> None:
+    """
+    Connect Many Pairs of Ports Concurrently.
+
+    Starts one `pw-link` process per pair without waiting for the previous
+    ones, then awaits all of them together, which is useful to restore a
+    saved set of connections.
+
+    ```bash
+    #!/bin/bash
+    # For each pair, concurrently:
+    pw-link <output> <input>
+    ```
+
+    Parameters
+    ----------
+    pairs:          Iterable[tuple[Port, Port]]
+                    Pairs of ports to connect, in either order.
+
+    Raises
+    ------
+    FailedToLinkPorts:  If `pw-link` failed to connect any of the pairs.
+    """
+
+    async def _connect(command: Tuple[str, ...]) -> int:
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        await process.communicate()
+        return process.returncode
+
+    commands = [port._join_arguments(other, _CONNECT_MSG) for port, other in pairs]
+    returncodes = await asyncio.gather(*(_connect(command) for command in commands))
+    _forget_links()
+    _raise_failed(commands, returncodes)
+
+
+class _Batch:
+    """Link changes deferred until the end of a `batch()` block."""
+
+    def __init__(self):
+        # (connect, command) in the order the changes were made
+        self.commands: List[Tuple[bool, Sequence[str]]] = []
+
+
+# Batch of the `batch()` block currently open in each thread, if any
+_BATCH = threading.local()
+
+
+def _defer(commands: Sequence[Sequence[str]], connect: bool) -> bool:
+    """Helper function to queue link changes while a batch is open"""
+    pending = getattr(_BATCH, "pending", None)
+    if pending is None:
+        return False
+    pending.commands.extend((connect, command) for command in commands)
+    return True
+
+
+@contextlib.contextmanager
+def batch() -> Iterator[None]:
+    """
+    Group Many Connections and Disconnections Together.
+
+    Within the block, connecting or disconnecting ports, stereo pairs and
+    links only records the change. When the block ends, the changes are run in
+    the order they were made, each run of consecutive connections (or
+    disconnections) as one batch of `pw-link` processes instead of one process
+    at a time. Nothing is run if the block raises, and a block opened inside
+    another one joins the outer batch.
+
+    Examples
+    --------
+    >>> from pipewire_python import link
+    >>> with link.batch():
+    ...     for output in link.list_outputs():
+    ...         output.connect(my_input)
+
+    Raises
+    ------
+    FailedToLinkPorts:  If `pw-link` failed to connect any of the pairs.
+    """
+    if getattr(_BATCH, "pending", None) is not None:
+        yield
+        return
+    pending = _BATCH.pending = _Batch()
+    try:
+        yield
+    finally:
+        _BATCH.pending = None
+    for connect, run in itertools.groupby(pending.commands, key=lambda item: item[0]):
+        commands = [command for _, command in run]
+        returncodes = _spawn_links(commands, connect=connect)
+        if connect:
+            _raise_failed(commands, returncodes)
+
+
+def _split_id_from_data(command) -> Iterator[Tuple[int, str]]:
+    """
+    Helper function to generate the (id, data) pairs of each channel, reusing
+    a recent listing of the same command while the cache is enabled
+    """
+    if _CACHE_TTL <= 0:
+        return _read_id_data(command)
+    rows = _fresh_listing(command)
+    if rows is None:
+        rows = tuple(_read_id_data(command))
+        _remember_listing(command, rows)
+    return iter(rows)
+
+
+def _fresh_listing(command) -> Optional[Tuple[Tuple[int, str], ...]]:
+    """Helper function to get a cached listing still within the cache TTL"""
+    if _CACHE_TTL <= 0:
+        return None
+    cached = _LISTING_CACHE.get(command)
+    if cached is None or time.monotonic() - cached[0] > _CACHE_TTL:
+        return None
+    return cached[1]
+
+
+def _remember_listing(command, rows: Tuple[Tuple[int, str], ...]) -> None:
+    """Helper function to cache a listing while the cache is enabled"""
+    if _CACHE_TTL > 0:
+        _LISTING_CACHE[command] = (time.monotonic(), rows)
+
+
+def _read_id_data(command) -> Iterator[Tuple[int, str]]:
+    """Helper function to run `pw-link` and parse its (id, data) pairs"""
+    return _parse_id_lines(
+        _iter_shell_command_lines([PW_LINK_COMMAND, command, "--id"])
+    )
+
+
+def _parse_id_lines(lines: Iterable[bytes]) -> Iterator[Tuple[int, str]]:
+    """Helper function to parse the (id, data) pairs of `pw-link --id` lines"""
+    for line in lines:
+        row_id, separator, data = line.strip().partition(b" ")
+        if separator:
+            yield int(row_id), data.lstrip().decode("utf-8")
+
+
+def _pair_stereo(ports: List[Port], stereo_class: type) -> tuple:
+    """
+    Helper function to pair the left/right ports of each device into their
+    stereo object, keeping the other ports on their own
+    """
+    devices: Dict[str, List[Port]] = {}
+    for port in ports:
+        devices.setdefault(port.device, []).append(port)
+    paired = []
+    for device_ports in devices.values():
+        lefts = [port for port in device_ports if port._channel == "FL"]
+        rights = [port for port in device_ports if port._channel == "FR"]
+        pairs = list(zip(lefts, rights))
+        paired.extend(stereo_class(left=left, right=right) for left, right in pairs)
+        # Ports without a left/right counterpart are kept on their own
+        in_pairs = {id(port) for pair in pairs for port in pair}
+        paired.extend(port for port in device_ports if id(port) not in in_pairs)
+    return tuple(paired)
+
+
+# Port class, stereo pair class and `pw-link` flag to list each kind of port
+_CLASSES = {
+    PortType.INPUT: (Input, StereoInput, "--input"),
+    PortType.OUTPUT: (Output, StereoOutput, "--output"),
+}
+
+
+def _list_ports(
+    kind: str, pair_stereo: bool, rows: Optional[Iterable[Tuple[int, str]]] = None
+) -> tuple:
+    """Helper function to list the ports of one kind, optionally paired"""
+    port_class, stereo_class, flag = _CLASSES[kind]
+    if rows is None:
+        rows = _split_id_from_data(flag)
+    ports = [
+        port_class(id=channel_id, device=device, name=name, port_type=kind)
+        for channel_id, channel_data in rows
+        for device, name in (channel_data.split(":", maxsplit=1),)
+    ]
+    if not pair_stereo:
+        return tuple(ports)
+    return _pair_stereo(ports, stereo_class)
+
+
+def list_inputs(pair_stereo: bool = True) -> Sequence[Union[StereoInput, Input]]:
     """
     List the Inputs Available on System.
 
@@ -480,51 +798,15 @@ def list_inputs(pair_stereo: bool = True) -> List[Union[StereoInput, Input]]:
 
     Returns
     -------
-    list[StereoInput | Input]:  List of the identified inputs or stereo input
+    tuple[StereoInput | Input]: Tuple of the identified inputs or stereo input
                                 pairs.
     """
-    ports = []
-
-    inputs = _split_id_from_data("--input")
-    if len(inputs) == 0:
-        return ports
-
-    for channel_id, channel_data in _split_id_from_data("--input"):
-        device, name = channel_data.split(":", maxsplit=1)
-        ports.append(
-            Input(
-                id=int(channel_id),
-                device=device,
-                name=name,
-                port_type=PortType.INPUT,
-            )
-        )
-    if not pair_stereo:
-        return ports
-    i = 0
-    num_ports = len(ports)
-    inputs = []
-    # Review the list of ports to Pair Appropriate ports into an Input
-    while i < num_ports:
-        i += 1
-        if i + 1 <= num_ports:
-            # If this channel device is the same as the next channel's device
-            if ports[i].device == ports[i - 1].device:
-                # Identify Left and Right ports
-                if "FL" in ports[i].name.upper():
-                    inputs.append(StereoInput(left=ports[i], right=ports[i - 1]))
-                    i += 1
-                    continue
-                if "FR" in ports[i].name.upper():
-                    inputs.append(StereoInput(right=ports[i], left=ports[i - 1]))
-                    i += 1
-                    continue
-        # Use Left-Channel Only if there's no left/right
-        inputs.append(ports[i - 1])
-    return inputs
-
-
-def list_outputs(pair_stereo: bool = True) -> List[Union[StereoOutput, Output]]:
+    return _list_ports(PortType.INPUT, pair_stereo)
+
+
+def list_outputs(
+    pair_stereo: bool = True,
+) -> Sequence[Union[StereoOutput, Output]]:
     """
     List the Outputs Available on System.
 
@@ -545,46 +827,163 @@ def list_outputs(pair_stereo: bool = True) -> List[Union[StereoOutput, Output]]:
 
     Returns
     -------
-    list[StereoOutput | Output]:    List of the identified outputs or stereo
+    tuple[StereoOutput | Output]:   Tuple of the identified outputs or stereo
                                     output pairs.
     """
-    ports = []
-    for channel_id, channel_data in _split_id_from_data("--output"):
-        device, name = channel_data.split(":", maxsplit=1)
-        ports.append(
-            Output(
-                id=int(channel_id),
-                device=device,
-                name=name,
-                port_type=PortType.OUTPUT,
-            )
+    return _list_ports(PortType.OUTPUT, pair_stereo)
+
+
+def _classify(row_id: int, data: str) -> tuple:
+    """
+    Helper function to tokenize one row of the links listing, either as
+    ("A", id, device, name) for the common port of a group or as
+    ("B", direction, link_id, id, device, name) for each of its links
+    """
+    match = _LINK_ARROW_REGEX.match(data)
+    if match:
+        direction, port_id, qualified = match.groups()
+        device, name = qualified.split(":", maxsplit=1)
+        return ("B", direction, row_id, int(port_id), device, name)
+    device, name = data.split(":", maxsplit=1)
+    return ("A", row_id, device, name)
+
+
+def _build_link(
+    direction: str, link_id: int, side_a: Sequence, side_b: Sequence
+) -> Link:
+    """Helper function to link two (id, device, name) ports in the direction"""
+    if direction == "|<-":
+        input_port, output_port = side_a, side_b
+    else:
+        input_port, output_port = side_b, side_a
+    return Link(
+        input=Input(
+            id=input_port[0],
+            device=input_port[1],
+            name=input_port[2],
+            port_type=PortType.INPUT,
+        ),
+        output=Output(
+            id=output_port[0],
+            device=output_port[1],
+            name=output_port[2],
+            port_type=PortType.OUTPUT,
+        ),
+        id=link_id,
+    )
+
+
+def _parse_links(
+    rows: Optional[Iterable[Tuple[int, str]]] = None,
+) -> List[Tuple[str, str, List[Link]]]:
+    """Helper function to group the links by their common (side "A") port"""
+    if rows is None:
+        rows = _split_id_from_data("--links")
+    link_groups = []
+    side_a = None
+    for row_id, data in rows:
+        token = _classify(row_id, data)
+        if token[0] == "A":
+            # Start a new group for this port
+            side_a = token[1:]
+            link_groups.append((side_a[1], side_a[2], []))
+        elif side_a is not None:
+            _, direction, link_id, *side_b = token
+            link_groups[-1][2].append(_build_link(direction, link_id, side_a, side_b))
+    # Ports listed without any link don't make a group
+    return [group for group in link_groups if group[2]]
+
+
+class _GraphMirror:
+    """
+    In-process mirror of the Pipewire links.
+
+    Keeps a single `pw-link --monitor --links --id` process running and
+    applies the links it reports as added or removed to an in-memory
+    dictionary, so listing the links doesn't spawn `pw-link` every time.
+    Each reported change also drops the cached links listing, which
+    `list_link_groups` may still be using. A report that can't be parsed
+    leaves the mirror out of date, so it stops being used from then on.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._links: Dict[int, Link] = {}
+        self._process: Optional[subprocess.Popen] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stale = False
+
+    def start(self) -> None:
+        """Start monitoring, after loading the links currently present."""
+        self._process = subprocess.Popen(
+            [PW_LINK_COMMAND, "--monitor", "--links", "--id"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
         )
-    if not pair_stereo:
-        return ports
-    i = 0
-    num_ports = len(ports)
-    outputs = []
-    # Review the list of ports to Pair Appropriate ports into an Output
-    while i < num_ports:
-        i += 1
-        if i + 1 <= num_ports:
-            # If this channel device is the same as the next channel's device
-            if ports[i].device == ports[i - 1].device:
-                # Identify Left and Right ports
-                if "FL" in ports[i].name.upper():
-                    outputs.append(StereoOutput(left=ports[i], right=ports[i - 1]))
-                    i += 1
-                    continue
-                if "FR" in ports[i].name.upper():
-                    outputs.append(StereoOutput(right=ports[i], left=ports[i - 1]))
-                    i += 1
-                    continue
-        # Use Left-Channel Only if there's no left/right
-        outputs.append(ports[i - 1])
-    return outputs
-
-
-def list_links() -> List[Link]:
+        # Events raised while loading are applied afterwards, and re-applying
+        # an addition or a removal leaves the mirror unchanged
+        try:
+            links = _parse_links(_read_id_data("--links"))
+        except BaseException:
+            self.stop()
+            raise
+        with self._lock:
+            self._links = {link.id: link for _, _, group in links for link in group}
+        self._thread = threading.Thread(target=self._follow, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the monitor process and its reader thread."""
+        if self._process is not None:
+            self._process.terminate()
+            self._process.wait()
+        if self._thread is not None:
+            self._thread.join()
+        self._process = None
+        self._thread = None
+
+    def links(self) -> Optional[Sequence[Link]]:
+        """Snapshot of the links currently present, None once out of date."""
+        with self._lock:
+            if self._stale:
+                return None
+            return tuple(self._links.values())
+
+    def _follow(self) -> None:
+        """Apply every change reported by the monitor process."""
+        side_a = None
+        for line in self._process.stdout:
+            match = _MONITOR_LINE_REGEX.match(line)
+            if not match:
+                continue
+            try:
+                token = _classify(int(match.group(2)), match.group(3).decode("utf-8"))
+            except ValueError:
+                # The missed change can't be recovered from the later reports
+                with self._lock:
+                    self._stale = True
+                _forget_links()
+                return
+            if token[0] == "A":
+                side_a = token[1:]
+                continue
+            _, direction, link_id, *side_b = token
+            with self._lock:
+                if match.group(1) == b"-":
+                    self._links.pop(link_id, None)
+                elif side_a is not None:
+                    self._links[link_id] = _build_link(
+                        direction, link_id, side_a, side_b
+                    )
+            # Links added or removed since the start make cached listings stale
+            if match.group(1) != b"=":
+                _forget_links()
+
+
+_GRAPH_MIRROR: Optional[_GraphMirror] = None
+
+
+def list_links() -> Sequence[Link]:
     """
     List the Links Available on System.
 
@@ -598,65 +997,20 @@ def list_links() -> List[Link]:
 
     Returns
     -------
-    list[Link]: List of the identified links.
-    """
-    # Parse STDOUT Data for Port Information
-    link_data_lines = _split_id_from_data("--links")
-    num_link_lines = len(link_data_lines)
-    i = 0
-    links = []
-    while i < (num_link_lines - 1):
-        # Split Side "A" (first) Port Data
-        side_a_device, side_a_name = link_data_lines[i][1].split(":")
-        # Determine Direction of Port Link
-        direction = link_data_lines[i + 1][1].split(" ", maxsplit=1)[0]
-        side_a_port = Port(
-            device=side_a_device,
-            name=side_a_name,
-            id=int(link_data_lines[i][0]),
-            port_type=PortType.INPUT if direction == "|<-" else PortType.OUTPUT,
-        )
-        i += 1
-        while i < num_link_lines:
-            # Split Side "B" (second) Port Data
-            side_b_data = link_data_lines[i][1].split(" ", maxsplit=1)[1].strip()
-            side_b_id, side_b_data = side_b_data.split(" ", maxsplit=1)
-            side_b_device, side_b_name = side_b_data.split(":")
-            side_b_port = Port(
-                device=side_b_device,
-                name=side_b_name,
-                id=int(side_b_id),
-                port_type=PortType.OUTPUT if direction == "|<-" else PortType.INPUT,
-            )
-            if side_a_port.port_type == PortType.INPUT:
-                links.append(
-                    Link(
-                        input=side_a_port,
-                        output=side_b_port,
-                        id=int(link_data_lines[i][0]),
-                    )
-                )
-            else:
-                links.append(
-                    Link(
-                        input=side_b_port,
-                        output=side_a_port,
-                        id=int(link_data_lines[i][0]),
-                    )
-                )
-            i += 1
-            if i == num_link_lines:
-                break
-            # Determine if Next Line is Associated with this Link
-            if (
-                "|->" not in link_data_lines[i][1]
-                and "|<-" not in link_data_lines[i][1]
-            ):
-                break  # Continue to Next Link Group
-    return links
+    tuple[Link]:    Tuple of the identified links.
+
+    Notes
+    -----
+    While the link monitor is running (see `start_link_monitor`), the links
+    are taken from its in-memory state instead of calling `pw-link`.
+    """
+    links = _GRAPH_MIRROR.links() if _GRAPH_MIRROR is not None else None
+    if links is not None:
+        return links
+    return tuple(link for _, _, links in _parse_links() for link in links)
 
 
-def list_link_groups() -> List[LinkGroup]:
+def list_link_groups() -> Sequence[LinkGroup]:
     """
     List the Groped Links Available on System.
 
@@ -671,63 +1025,333 @@ def list_link_groups() -> List[LinkGroup]:
 
     Returns
     -------
-    dict[str, Link]: Dictionary of the identified links, keyed by their names.
+    tuple[LinkGroup]:   Tuple of the identified link groups, one for each
+                        common port.
     """
-    # Parse STDOUT Data for Port Information
-    link_data_lines = _split_id_from_data("--links")
-    num_link_lines = len(link_data_lines)
-    i = 0
-    link_groups = []
-    while i < (num_link_lines - 1):
-        # Split Side "A" (first) Port Data
-        side_a_device, side_a_name = link_data_lines[i][1].split(":")
-        # Determine Direction of Port Link
-        direction = link_data_lines[i + 1][1].split(" ", maxsplit=1)[0]
-        side_a_port = Port(
-            device=side_a_device,
-            name=side_a_name,
-            id=int(link_data_lines[i][0]),
-            port_type=PortType.INPUT if direction == "|<-" else PortType.OUTPUT,
+    return tuple(
+        LinkGroup(common_device=device, common_name=name, links=links)
+        for device, name, links in _parse_links()
+    )
+
+
+async def list_all_async(
+    pair_stereo: bool = True,
+) -> Tuple[
+    Sequence[Union[StereoInput, Input]],
+    Sequence[Union[StereoOutput, Output]],
+    Sequence[Link],
+]:
+    """
+    List the Inputs, Outputs and Links Available on System, Concurrently.
+
+    Runs the three `pw-link` listings at the same time instead of one after
+    another, then builds the same results as `list_inputs`, `list_outputs`
+    and `list_links`.
+
+    ```bash
+    #!/bin/bash
+    # Get inputs, outputs and links from output of, concurrently:
+    pw-link --input --id
+    pw-link --output --id
+    pw-link --links --id
+    ```
+
+    Parameters
+    ----------
+    pair_stereo:    bool, optional
+                    Control to opt for pairing input and output ports into
+                    their corresponding stereo pairs (left/right).
+
+    Returns
+    -------
+    tuple[tuple, tuple, tuple]: The inputs, outputs and links, as returned by
+                                `list_inputs`, `list_outputs` and
+                                `list_links`.
+    """
+
+    async def _rows(command: str) -> Tuple[Tuple[int, str], ...]:
+        rows = _fresh_listing(command)
+        if rows is not None:
+            return rows
+        process = await asyncio.create_subprocess_exec(
+            PW_LINK_COMMAND,
+            command,
+            "--id",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
         )
-        i += 1
-        links = []
-        while i < num_link_lines:
-            # Split Side "B" (second) Port Data
-            side_b_data = link_data_lines[i][1].split(" ", maxsplit=1)[1].strip()
-            side_b_id, side_b_data = side_b_data.split(" ", maxsplit=1)
-            side_b_device, side_b_name = side_b_data.split(":")
-            side_b_port = Port(
-                device=side_b_device,
-                name=side_b_name,
-                id=int(side_b_id),
-                port_type=PortType.OUTPUT if direction == "|<-" else PortType.INPUT,
-            )
-            if side_a_port.port_type == PortType.INPUT:
-                links.append(
-                    Link(
-                        input=side_a_port,
-                        output=side_b_port,
-                        id=int(link_data_lines[i][0]),
-                    )
-                )
-            else:
-                links.append(
-                    Link(
-                        input=side_b_port,
-                        output=side_a_port,
-                        id=int(link_data_lines[i][0]),
-                    )
-                )
-            i += 1
-            if i == num_link_lines:
-                break
-            # Determine if Next Line is Associated with this Link
-            if (
-                "|->" not in link_data_lines[i][1]
-                and "|<-" not in link_data_lines[i][1]
-            ):
-                break  # Continue to Next Link Group
-        link_groups.append(
-            LinkGroup(common_device=side_a_device, common_name=side_a_name, links=links)
+        stdout, _ = await process.communicate()
+        rows = tuple(_parse_id_lines(stdout.splitlines()))
+        _remember_listing(command, rows)
+        return rows
+
+    commands = ["--input", "--output"]
+    # The links are already known while the link monitor runs
+    links = _GRAPH_MIRROR.links() if _GRAPH_MIRROR is not None else None
+    if links is None:
+        commands.append("--links")
+    listings = await asyncio.gather(*(_rows(command) for command in commands))
+    inputs = _list_ports(PortType.INPUT, pair_stereo, listings[0])
+    outputs = _list_ports(PortType.OUTPUT, pair_stereo, listings[1])
+    if links is None:
+        links = tuple(
+            link for _, _, group in _parse_links(listings[2]) for link in group
         )
-    return link_groups
+    return inputs, outputs, links
+
+
+def list_all(
+    pair_stereo: bool = True,
+) -> Tuple[
+    Sequence[Union[StereoInput, Input]],
+    Sequence[Union[StereoOutput, Output]],
+    Sequence[Link],
+]:
+    """
+    List the Inputs, Outputs and Links Available on System.
+
+    Synchronous wrapper of `list_all_async`, it must not be called from a
+    running event loop (await `list_all_async` there instead).
+
+    Parameters
+    ----------
+    pair_stereo:    bool, optional
+                    Control to opt for pairing input and output ports into
+                    their corresponding stereo pairs (left/right).
+
+    Returns
+    -------
+    tuple[tuple, tuple, tuple]: The inputs, outputs and links, as returned by
+                                `list_inputs`, `list_outputs` and
+                                `list_links`.
+    """
+    return asyncio.run(list_all_async(pair_stereo))
+
+
+def set_cache_ttl(seconds: float) -> None:
+    """
+    Set How Long a Listing of Ports or Links May Be Reused.
+
+    `list_inputs`, `list_outputs`, `list_links` and `list_link_groups` spawn
+    `pw-link` on every call; with a TTL set, calls repeated within that many
+    seconds reuse the previous listing instead. Disabled (0) by default.
+
+    Parameters
+    ----------
+    seconds:    float
+                Maximum age of a reused listing, 0 disables the cache.
+    """
+    global _CACHE_TTL  # pylint: disable=global-statement
+    _CACHE_TTL = float(seconds)
+    invalidate_cache()
+
+
+def invalidate_cache() -> None:
+    """
+    Drop the Cached Listings of Ports and Links.
+
+    Links changed through this module are already dropped from the cache;
+    call it after the graph was changed by other means while the cache is
+    enabled, the next listing will spawn `pw-link` again.
+    """
+    _LISTING_CACHE.clear()
+
+
+def start_link_monitor() -> None:
+    """
+    Start Mirroring the Pipewire Links In-Process.
+
+    Spawns a single, long-running `pw-link` monitor whose reports keep an
+    in-memory copy of the links up to date; while it runs, `list_links` reads
+    that copy instead of spawning `pw-link` on each call. Useful for
+    long-running programs that list the links repeatedly.
+
+    ```bash
+    #!/bin/bash
+    # Follow the changes reported by:
+    pw-link --monitor --links --id
+    ```
+    """
+    global _GRAPH_MIRROR  # pylint: disable=global-statement
+    if _GRAPH_MIRROR is not None:
+        return
+    mirror = _GraphMirror()
+    mirror.start()
+    _GRAPH_MIRROR = mirror
+
+
+def stop_link_monitor() -> None:
+    """
+    Stop Mirroring the Pipewire Links In-Process.
+
+    Terminates the monitor started with `start_link_monitor`, `list_links`
+    goes back to calling `pw-link` on each call.
+    """
+    global _GRAPH_MIRROR  # pylint: disable=global-statement
+    if _GRAPH_MIRROR is None:
+        return
+    _GRAPH_MIRROR.stop()
+    _GRAPH_MIRROR = None
+
+
+atexit.register(stop_link_monitor)
+
+
+class _PwCliSession:
+    """
+    Long-running `pw-cli` client used to destroy links by identifier.
+
+    Writing one command line to the same process reuses its connection to
+    Pipewire, instead of starting a new `pw-link` client for each change.
+    `pw-cli` prints nothing for a command that succeeds, so each group of
+    commands is followed by an unknown command numbered after
+    `_SYNC_COMMAND`, whose error line marks the end of their replies.
+    """
+
+    # Seconds waited for the replies of a group of commands
+    _REPLY_TIMEOUT = 1.0
+
+    def __init__(self):
+        self._process: Optional[subprocess.Popen] = None
+        self._replies: "queue.Queue[Optional[bytes]]" = queue.Queue()
+        self._syncs = itertools.count(1)
+        # Marker of a group whose replies were not all read before its timeout
+        self._late_marker: Optional[bytes] = None
+
+    def start(self) -> None:
+        """Start the `pw-cli` process, reading commands from a pipe."""
+        # "-" reads the commands from stdin without the interactive prompt
+        self._process = subprocess.Popen(
+            [PW_CLI_COMMAND, "-"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+        )
+        threading.Thread(
+            target=self._read_replies, args=(self._process.stdout,), daemon=True
+        ).start()
+
+    def _read_replies(self, stdout) -> None:
+        """Queue each line printed by `pw-cli`, then None once it quits."""
+        for line in stdout:
+            self._replies.put(line)
+        self._replies.put(None)
+
+    def destroy(self, object_ids: Sequence[int]) -> bool:
+        """
+        Send a destroy command per object, False if `pw-cli` is gone or did
+        not confirm all of them (e.g. an unknown or not yet listed global).
+        """
+        if self._process is None or self._process.poll() is not None:
+            return False
+        sync = f"{_SYNC_COMMAND}-{next(self._syncs)}"
+        commands = "".join(f"destroy {object_id}\n" for object_id in object_ids)
+        try:
+            self._process.stdin.write(f"{commands}{sync}\n".encode("utf-8"))
+            self._process.stdin.flush()
+        except OSError:
+            return False
+        # pw-cli replies: Error: "Command "<sync>" does not exist. ..."
+        marker = f'"{sync}"'.encode("utf-8")
+        deadline = time.monotonic() + self._REPLY_TIMEOUT
+        succeeded = True
+        while True:
+            try:
+                line = self._replies.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                self._late_marker = marker
+                return False
+            if line is None:
+                return False
+            if self._late_marker is not None and self._late_marker in line:
+                # Errors read so far were replies to the late group
+                self._late_marker = None
+                succeeded = True
+            elif marker in line:
+                return succeeded
+            elif line.startswith(_PW_CLI_ERROR):
+                succeeded = False
+
+    def stop(self) -> None:
+        """Close the command pipe and wait for `pw-cli` to quit."""
+        if self._process is None:
+            return
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self._process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        self._process = None
+
+
+_PW_CLI_SESSION: Optional[_PwCliSession] = None
+
+# Command unknown to `pw-cli`, see `_PwCliSession`
+_SYNC_COMMAND = "pipewire-python-sync"
+
+# Start of the line `pw-cli` prints for a command that failed
+_PW_CLI_ERROR = b'Error: "'
+
+
+def _destroy_links(links: Sequence[Link]) -> bool:
+    """
+    Helper function to destroy links by identifier through the `pw-cli`
+    session, False when they have to be disconnected with `pw-link` instead
+    """
+    if _PW_CLI_SESSION is None or getattr(_BATCH, "pending", None) is not None:
+        return False
+    if any(link.id is None for link in links):
+        return False
+    if not _PW_CLI_SESSION.destroy([link.id for link in links]):
+        return False
+    _forget_links()
+    return True
+
+
+def start_pw_cli_session() -> None:
+    """
+    Start a Persistent `pw-cli` Session to Remove Links.
+
+    While it runs, disconnecting a `Link`, `StereoLink` or `LinkGroup` whose
+    identifiers are known (as listed by `list_links`) writes a `destroy`
+    command to the session instead of spawning `pw-link`. When `pw-cli`
+    rejects a command (e.g. an identifier it has not listed yet) or does not
+    answer in time, the links are disconnected with `pw-link` instead; errors
+    Pipewire reports later, once it applied the command, are not waited for.
+    Links without an identifier, ports and stereo pairs keep using `pw-link`,
+    as does everything once the session has quit.
+
+    ```bash
+    #!/bin/bash
+    # For each link, on the standard input of a single:
+    pw-cli
+    destroy <link-id>
+    ```
+    """
+    global _PW_CLI_SESSION  # pylint: disable=global-statement
+    if _PW_CLI_SESSION is not None:
+        return
+    session = _PwCliSession()
+    session.start()
+    _PW_CLI_SESSION = session
+
+
+def stop_pw_cli_session() -> None:
+    """
+    Stop the Persistent `pw-cli` Session.
+
+    Closes the session started with `start_pw_cli_session`, links are
+    disconnected with `pw-link` again.
+    """
+    global _PW_CLI_SESSION  # pylint: disable=global-statement
+    if _PW_CLI_SESSION is None:
+        return
+    _PW_CLI_SESSION.stop()
+    _PW_CLI_SESSION = None
+
+
+atexit.register(stop_pw_cli_session)
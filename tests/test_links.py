@@ -1,4 +1,18 @@
+import io
+import os
+import sys
+
+import pytest
+
+from pipewire_python import link
+from pipewire_python._utils import _spawn_batch
 from pipewire_python.link import (
+    InvalidLink,
+    Input,
+    Output,
+    Port,
+    PortType,
+    batch,
     list_inputs,
     list_outputs,
     list_links,
@@ -13,15 +27,16 @@ def test_list():
     inputs = list_inputs()
     if len(inputs) == 0:
         return  # No inputs, no point in testing
+    outputs = list_outputs()
 
-    assert list_inputs()
-    assert list_outputs()
+    assert inputs
+    assert outputs
     assert list_links()
     assert list_link_groups()
 
     # Disconnect everything
-    for in_dev in list_inputs():
-        for out_dev in list_outputs():
+    for in_dev in inputs:
+        for out_dev in outputs:
             if isinstance(in_dev, StereoInput) and isinstance(out_dev, StereoOutput):
                 in_dev.disconnect(out_dev)
 
@@ -31,13 +46,275 @@ def test_list():
 def test_connect_disconnect():
     """Test that all points quickly connect then disconnect."""
     links = []
+    inputs = list_inputs()
+    outputs = list_outputs()
 
-    # Connect everything
-    for in_dev in list_inputs():
-        for out_dev in list_outputs():
-            if isinstance(in_dev, StereoInput) and isinstance(out_dev, StereoOutput):
-                links.append(in_dev.connect(out_dev))
+    # Connect everything, in a single batch
+    with batch():
+        for in_dev in inputs:
+            for out_dev in outputs:
+                if isinstance(in_dev, StereoInput) and isinstance(
+                    out_dev, StereoOutput
+                ):
+                    links.append(in_dev.connect(out_dev))
 
     # Disconnect Afterwards
     for link in links:
         link.disconnect()
+
+
+def test_invalid_link_with_plain_port():
+    """Test that same direction ports can't be linked, either way around."""
+    output = Output("a", "out_FL", 1, PortType.OUTPUT)
+    other = Port("b", "x_FL", 2, PortType.OUTPUT)
+    with pytest.raises(InvalidLink):
+        output.connect(other)
+    with pytest.raises(InvalidLink):
+        other.connect(output)
+    with pytest.raises(InvalidLink):
+        Input("c", "in_FL", 3, PortType.INPUT).disconnect(
+            Port("d", "y_FL", 4, PortType.INPUT)
+        )
+
+
+def test_batch_keeps_order(monkeypatch):
+    """Test that a batch runs connections and disconnections in order."""
+    spawned = []
+
+    def _spawn_batch(commands):
+        spawned.append(list(commands))
+        return [0] * len(commands)
+
+    monkeypatch.setattr(link, "_spawn_batch", _spawn_batch)
+    output = Output("a", "out_FL", 1, PortType.OUTPUT)
+    left = Input("c", "in_FL", 3, PortType.INPUT)
+    right = Input("c", "in_FR", 4, PortType.INPUT)
+    with batch():
+        output.connect(left)
+        output.connect(right)
+        output.disconnect(left)
+        right.disconnect(output)
+        output.connect(left)
+
+    assert spawned == [
+        [("pw-link", "a:out_FL", "c:in_FL"), ("pw-link", "a:out_FL", "c:in_FR")],
+        [
+            ("pw-link", "--disconnect", "a:out_FL", "c:in_FL"),
+            ("pw-link", "--disconnect", "a:out_FL", "c:in_FR"),
+        ],
+        [("pw-link", "a:out_FL", "c:in_FL")],
+    ]
+
+
+# Canned `pw-link --input --id` output
+INPUT_LINES = [
+    b"  50 alsa_output.pci:playback_FL\n",
+    b"  52 alsa_output.pci:playback_LFE\n",
+    b"  51 alsa_output.pci:playback_FR\n",
+    b"  61 other:input_MONO\n",
+    b"  60 app:input_FR\n",
+    b"  62 app:input_FL\n",
+]
+
+# Canned `pw-link --links --id` output
+LINK_LINES = [
+    b"  44 alsa_output.pci:monitor_FL\n",
+    b"  80   |-> 60 app:input_FR\n",
+    b"  81   |-> 62 app:input_FL\n",
+    b"  45 alsa_output.pci:monitor_FR\n",
+    b"  50 alsa_output.pci:playback_FL\n",
+    b"  90   |<- 70 firefox:output_FL\n",
+]
+
+
+def test_parse_id_lines():
+    """Test that ids and data are split out of `pw-link --id` lines."""
+    assert list(link._parse_id_lines(INPUT_LINES[:2] + [b"\n"])) == [
+        (50, "alsa_output.pci:playback_FL"),
+        (52, "alsa_output.pci:playback_LFE"),
+    ]
+
+
+def test_list_ports_pairs_stereo():
+    """Test that left/right ports of a device pair up, the others stay alone."""
+    rows = list(link._parse_id_lines(INPUT_LINES))
+
+    ports = link._list_ports(PortType.INPUT, pair_stereo=False, rows=rows)
+    assert [port.id for port in ports] == [50, 52, 51, 61, 60, 62]
+    assert all(isinstance(port, Input) for port in ports)
+
+    paired = link._list_ports(PortType.INPUT, pair_stereo=True, rows=rows)
+    assert [type(item) for item in paired] == [
+        StereoInput,
+        Input,
+        Input,
+        StereoInput,
+    ]
+    # Left and right channels are paired even when not listed next to each other
+    assert (paired[0].left.id, paired[0].right.id) == (50, 51)
+    assert paired[1].name == "playback_LFE"
+    assert paired[2].name == "input_MONO"
+    assert (paired[3].left.id, paired[3].right.id) == (62, 60)
+
+
+def test_parse_links():
+    """Test that the links listing is grouped by the common port."""
+    groups = link._parse_links(rows=list(link._parse_id_lines(LINK_LINES)))
+
+    # monitor_FR has no link, so no group
+    assert [(device, name) for device, name, _ in groups] == [
+        ("alsa_output.pci", "monitor_FL"),
+        ("alsa_output.pci", "playback_FL"),
+    ]
+    first, second = groups[0][2]
+    assert (first.id, first.output.id, first.input.id) == (80, 44, 60)
+    assert (second.id, second.output.id, second.input.id) == (81, 44, 62)
+    (reverse,) = groups[1][2]
+    assert (reverse.id, reverse.output.name, reverse.input.name) == (
+        90,
+        "output_FL",
+        "playback_FL",
+    )
+    assert isinstance(reverse.input, Input) and isinstance(reverse.output, Output)
+
+
+def test_monitor_follows_changes():
+    """Test that the links mirror applies the monitor additions and removals."""
+
+    class _Process:
+        stdout = [
+            b"= 44 alsa_output.pci:monitor_FL\n",
+            b"=   80   |-> 60 app:input_FR\n",
+            b"+ 44 alsa_output.pci:monitor_FL\n",
+            b"+   81   |-> 62 app:input_FL\n",
+            b"- 44 alsa_output.pci:monitor_FL\n",
+            b"-   80   |-> 60 app:input_FR\n",
+        ]
+
+    mirror = link._GraphMirror()
+    mirror._process = _Process()
+    mirror._follow()
+
+    (only,) = mirror.links()
+    assert (only.id, only.output.name) == (81, "monitor_FL")
+    assert only.input == Input("app", "input_FL", 62, PortType.INPUT)
+
+
+def test_monitor_unparsable_line(monkeypatch):
+    """Test that listing falls back to pw-link once the mirror missed a change."""
+
+    class _Process:
+        stdout = [
+            b"+ 44 alsa_output.pci:monitor_FL\n",
+            b"+   81   |-> 62 app:input_FL\n",
+            b"+ 45 no-colon-here\n",
+            b"+   82   |-> 63 app:input_FR\n",
+        ]
+
+    mirror = link._GraphMirror()
+    mirror._process = _Process()
+    mirror._follow()
+    assert mirror.links() is None
+
+    reads = []
+
+    def _read_id_data(command):
+        reads.append(command)
+        return link._parse_id_lines(LINK_LINES)
+
+    monkeypatch.setattr(link, "_GRAPH_MIRROR", mirror)
+    monkeypatch.setattr(link, "_read_id_data", _read_id_data)
+    assert link.list_links()
+    assert reads == ["--links"]
+
+
+def test_cache_ttl(monkeypatch):
+    """Test that listings are reused within the TTL and dropped on changes."""
+    reads = []
+
+    def _read_id_data(command):
+        reads.append(command)
+        return link._parse_id_lines(INPUT_LINES)
+
+    monkeypatch.setattr(link, "_read_id_data", _read_id_data)
+    try:
+        link.set_cache_ttl(0)
+        link.list_inputs()
+        link.list_inputs()
+        assert len(reads) == 2
+
+        link.set_cache_ttl(60)
+        assert link.list_inputs() == link.list_inputs()
+        assert len(reads) == 3
+
+        link.invalidate_cache()
+        link.list_inputs(pair_stereo=False)
+        assert len(reads) == 4
+    finally:
+        link.set_cache_ttl(0)
+
+
+def test_port_equality():
+    """Test that ports are equal by class, device and name, not by id."""
+    port = Input("app", "input_FL", 62, PortType.INPUT)
+    same = Input("app", "input_FL", 63, PortType.INPUT)
+    assert port == same and hash(port) == hash(same)
+    assert port != Input("other", "input_FL", 62, PortType.INPUT)
+    assert port != Input("app", "input_FR", 62, PortType.INPUT)
+    assert port != Output("app", "input_FL", 62, PortType.OUTPUT)
+    assert len({port, same}) == 1
+
+
+def test_spawn_batch_falls_back(monkeypatch):
+    """Test that commands posix_spawn can't start run through subprocess."""
+    if not hasattr(os, "posix_spawn"):
+        return  # Python 3.7, always subprocess
+    posix_spawn = os.posix_spawn
+    spawned = []
+
+    def _posix_spawn(*args, **kwargs):
+        # Only calls from _spawn_batch, subprocess may use posix_spawn too
+        if sys._getframe(1).f_globals["__name__"] == "pipewire_python._utils":
+            spawned.append(list(args[1]))
+            if len(spawned) == 2:
+                raise OSError("refused")
+        return posix_spawn(*args, **kwargs)
+
+    monkeypatch.setattr(os, "posix_spawn", _posix_spawn)
+    commands = [["sh", "-c", "exit 0"], ["sh", "-c", "exit 3"], ["true"]]
+    assert _spawn_batch(commands) == [0, 3, 0]
+    # After the refused command, the remaining ones are left to subprocess
+    assert spawned == commands[:2]
+
+
+def test_pw_cli_session_replies():
+    """Test that destroys are only confirmed by the marker of their own group."""
+
+    class _Process:
+        stdin = io.BytesIO()
+
+        def poll(self):
+            return None
+
+    def _sync_reply(number):
+        return f'Error: "Command "pipewire-python-sync-{number}" does not exist."\n'
+
+    session = link._PwCliSession()
+    session._process = _Process()
+    session._REPLY_TIMEOUT = 0.01
+    # No reply in time, not confirmed
+    assert not session.destroy([80])
+    # Late replies of the first group come before those of the second one
+    session._replies.put(b'Error: "destroy: unknown global 80"\n')
+    session._replies.put(_sync_reply(1).encode())
+    session._replies.put(b"port of the terror device\n")
+    session._replies.put(_sync_reply(2).encode())
+    assert session.destroy([81])
+    session._replies.put(b'Error: "destroy: unknown global 5"\n')
+    session._replies.put(_sync_reply(3).encode())
+    assert not session.destroy([5])
+    assert _Process.stdin.getvalue() == (
+        b"destroy 80\npipewire-python-sync-1\n"
+        b"destroy 81\npipewire-python-sync-2\n"
+        b"destroy 5\npipewire-python-sync-3\n"
+    )
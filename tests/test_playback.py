@@ -1,4 +1,7 @@
+import pytest
+
 from pipewire_python.controller import Controller
+from pipewire_python._utils import _parse_wav_header
 
 # import requests
 
@@ -21,6 +24,7 @@ def test_playback():
         _format="f64",
         volume=0.98,
         quality=4,
+        buffer_frames=1024,
         # Debug
         verbose=True,
     )
@@ -31,3 +35,33 @@ def test_playback():
     )
 
     assert type(audio_controller.get_config())
+
+
+def test_buffer_frames_rejects_non_integers():
+    audio_controller = Controller()
+    latency = audio_controller.get_config()["--latency"]
+    for buffer_frames in (True, 1.5, -256, "1024"):
+        with pytest.raises(ValueError):
+            audio_controller.set_config(buffer_frames=buffer_frames)
+    assert audio_controller.get_config()["--latency"] == latency
+
+
+def test_wav_header(tmp_path):
+    wav_info = _parse_wav_header(audio_filename="docs/beers.wav")
+    # beers.wav has a LIST chunk between "fmt " and "data"
+    assert wav_info == {
+        "rate": 44100,
+        "channels": 2,
+        "format": "s16",
+        "data_offset": 78,
+        "data_size": 1331712,
+    }
+    assert _parse_wav_header(audio_filename="README.md") is None
+
+    # "fmt " chunk shorter than the 16 bytes of a PCM format
+    short = tmp_path / "short.wav"
+    short.write_bytes(b"RIFF\x18\x00\x00\x00WAVEfmt \x08\x00\x00\x00" + bytes(8))
+    assert _parse_wav_header(audio_filename=str(short)) is None
+    # Truncated "fmt " chunk
+    short.write_bytes(b"RIFF\x1c\x00\x00\x00WAVEfmt \x10\x00\x00\x00" + bytes(8))
+    assert _parse_wav_header(audio_filename=str(short)) is None
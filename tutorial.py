@@ -1,46 +1,61 @@
 from pipewire_python.controller import Controller
 
-# import asyncio
-
-#########################
-# PLAYBACK              #
-#########################
-# normal way
-audio_controller = Controller(verbose=True)
-audio_controller.set_config(
-    rate=384000,
-    channels=2,
-    _format="f64",
-    volume=0.98,
-    quality=4,
-    # Debug
-    verbose=True,
-)
-audio_controller.playback(
-    audio_filename="docs/beers.wav",
-    # Debug
-    verbose=True,
-)
+# A single controller is reused, `pw-cat -h` is only run once
+with Controller(verbose=True) as audio_controller:
+    #########################
+    # RECORD                #
+    #########################
+    # normal way
+    audio_controller.record(
+        audio_filename="docs/5sec_record.wav",
+        timeout_seconds=5,
+        # Debug
+        verbose=True,
+    )
 
-# async way
-# player = Player()
-# asyncio.run(player.play_wav_file_async('docs/beers.wav',
-#                                        verbose=True))
+    #########################
+    # PLAYBACK              #
+    #########################
+    # normal way
+    audio_controller.set_config(
+        rate=384000,
+        channels=2,
+        _format="f64",
+        volume=0.98,
+        quality=4,
+        buffer_frames=1024,
+        # Debug
+        verbose=True,
+    )
+    audio_controller.playback(
+        audio_filename="docs/beers.wav",
+        # Debug
+        verbose=True,
+    )
 
-#########################
-# RECORD                #
-#########################
+    #########################
+    # PLAYBACK AND RECORD   #
+    #########################
+    # both at the same time, taking as long as the longest one
+    audio_controller.run_batch(
+        [
+            ("playback", "docs/beers.wav"),
+            ("record", "docs/5sec_record.wav", 5),  # timeout_seconds
+        ],
+        # Debug
+        verbose=True,
+    )
 
-# normal way
-audio_controller = Controller(verbose=True)
-audio_controller.record(
-    audio_filename="docs/5sec_record.wav",
-    timeout_seconds=5,
-    # Debug
-    verbose=True,
-)
+    # without waiting, the `with` block waits for it on exit
+    audio_controller.playback(
+        audio_filename="docs/beers.wav",
+        await_completion=False,
+    )
 
-# async way
-# player = Player()
-# asyncio.run(player.record_wav_file_async('docs/5sec_record.wav',
-#                                          verbose=True))
+# async way, inside your own event loop
+# import asyncio
+# audio_controller = Controller()
+# asyncio.run(audio_controller.run_batch_async([
+#     ("playback", "docs/beers.wav"),
+#     ("record", "docs/5sec_record.wav", 5),
+# ]))